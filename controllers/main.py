@@ -3,12 +3,25 @@
 from odoo import http, fields, _
 from odoo.http import request
 from odoo.exceptions import ValidationError, UserError
+import functools
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+import psycopg2
+import psycopg2.errors
+import re
+from datetime import datetime, time, timedelta
 
 _logger = logging.getLogger(__name__)
 
+_ID_PATTERN = re.compile(r'\d+')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(value, fmt):
+    """Parse a date/datetime string, memoizing recent (value, format) pairs"""
+    return datetime.strptime(value, fmt)
+
 
 class SportsBookingController(http.Controller):
     """
@@ -16,6 +29,10 @@ class SportsBookingController(http.Controller):
     Handles public website routes for facility browsing and booking
     """
 
+    # Rendered by name: ir.ui.view already caches the key -> view lookup and the
+    # compiled QWeb, and website-specific copies of the view must stay reachable
+    _FACILITIES_LIST_TEMPLATE = 'sports_booking.facilities_list_template'
+
     @http.route('/sports', type='http', auth='public', website=True)
     def sports_homepage(self, **kwargs):
         """
@@ -60,7 +77,8 @@ class SportsBookingController(http.Controller):
                 selected_facility = request.env['sports.facility'].sudo().browse(int(facility_id))
             
             # Get current user's partner if logged in
-            partner = request.env.user.partner_id if not request.env.user._is_public() else False
+            user = request.env.user
+            partner = user.partner_id if not user._is_public() else False
             
             values = {
                 'facilities': facilities,
@@ -114,7 +132,7 @@ class SportsBookingController(http.Controller):
             
             # Parse preferred date
             try:
-                pref_date = datetime.strptime(preferred_date, '%Y-%m-%d').date()
+                pref_date = _parse_dt(preferred_date, '%Y-%m-%d').date()
             except ValueError:
                 return request.render('sports_booking.waitlist_error_template', {
                     'error': 'Invalid date format'
@@ -151,33 +169,58 @@ class SportsBookingController(http.Controller):
         :param facility_type: Optional filter for facility type (court, gym, pool, field)
         :return: Rendered template with facilities list
         """
-        try:
-            # Build domain for facility search
-            domain = [('active', '=', True)]
-            
-            # Add facility_type filter if provided
-            if facility_type:
-                domain.append(('facility_type', '=', facility_type))
-            
-            # Fetch facilities
-            facilities = request.env['sports.facility'].sudo().search(domain, order='name')
-            
-            # Get all facility types for filter dropdown
-            facility_types = request.env['sports.facility'].sudo()._fields['facility_type'].selection
-            
-            # Prepare values for template
-            values = {
-                'facilities': facilities,
-                'facility_types': facility_types,
-                'current_filter': facility_type,
-                'page_name': 'Sports Facilities',
-            }
-            
-            return request.render('sports_booking.facilities_list_template', values)
-            
-        except Exception as e:
-            _logger.error('Error loading facilities: %s', str(e))
-            return request.render('website.404')
+        # Build domain for facility search
+        domain = [('active', '=', True)]
+        
+        # Add facility_type filter if provided
+        if facility_type:
+            domain.append(('facility_type', '=', facility_type))
+        
+        # Fetch facilities together with the fields rendered by the template
+        facilities = request.env['sports.facility'].sudo().search_fetch(domain, [
+            'name', 'facility_type', 'capacity', 'location', 'hourly_rate', 'currency_id',
+            'write_date',
+        ], order='name')
+        
+        # Count active bookings for every listed facility in one aggregate query
+        booking_groups = request.env['sports.booking'].sudo()._read_group([
+            ('facility_id', 'in', facilities.ids),
+            ('status', 'in', ['draft', 'confirmed']),
+        ], groupby=['facility_id'], aggregates=['__count'])
+        booking_counts = {facility.id: count for facility, count in booking_groups}
+        
+        # Answer repeated views with 304 while the listed data is unchanged
+        is_public = request.env.user._is_public()
+        etag = '"%s"' % hashlib.md5(str((
+            facility_type,
+            request.env.lang,
+            # The page differs per user (navigation, record rules)
+            request.env.uid,
+            facilities.ids,
+            max(facilities.mapped('write_date'), default=None),
+            sorted(booking_counts.items()),
+        )).encode()).hexdigest()
+        cache_headers = [
+            ('Cache-Control', 'public, max-age=60' if is_public else 'private, max-age=60'),
+            ('ETag', etag),
+        ]
+        if request.httprequest.headers.get('If-None-Match') == etag:
+            return request.make_response('', headers=cache_headers, status=304)
+        
+        # Get all facility types for filter dropdown; the field of this
+        # database's registry, so selection_add from other modules is included
+        facility_types = request.env['sports.facility']._fields['facility_type'].selection
+        
+        # Prepare values for template
+        values = {
+            'facilities': facilities,
+            'booking_counts': booking_counts,
+            'facility_types': facility_types,
+            'current_filter': facility_type,
+            'page_name': 'Sports Facilities',
+        }
+        
+        return request.render(self._FACILITIES_LIST_TEMPLATE, values, headers=dict(cache_headers))
 
     @http.route('/sports/booking/<int:facility_id>', type='http', auth='public', website=True)
     def booking_form(self, facility_id, **kwargs):
@@ -187,38 +230,34 @@ class SportsBookingController(http.Controller):
         :param facility_id: ID of the facility to book
         :return: Rendered booking form template
         """
-        try:
-            # Fetch the facility
-            facility = request.env['sports.facility'].sudo().browse(facility_id)
-            
-            # Check if facility exists
-            if not facility.exists():
-                _logger.warning('Facility with ID %s not found', facility_id)
-                return request.render('website.404')
-            
-            # Get available equipment for this facility
-            equipment = request.env['sports.equipment'].sudo().search([
-                ('facility_ids', 'in', [facility_id]),
-                ('quantity_available', '>', 0),
-                ('active', '=', True)
-            ])
-            
-            # Get current user's partner if logged in
-            partner = request.env.user.partner_id if request.env.user._is_public() is False else False
-            
-            # Prepare values for template
-            values = {
-                'facility': facility,
-                'equipment': equipment,
-                'partner': partner,
-                'page_name': f'Book {facility.name}',
-            }
-            
-            return request.render('sports_booking.booking_form_template', values)
-            
-        except Exception as e:
-            _logger.error('Error loading booking form for facility %s: %s', facility_id, str(e))
+        # Fetch the facility
+        facility = request.env['sports.facility'].sudo().browse(facility_id)
+        
+        # Check if facility exists
+        if not facility.exists():
+            _logger.warning('Facility with ID %s not found', facility_id)
             return request.render('website.404')
+        
+        # Get available equipment for this facility
+        equipment = request.env['sports.equipment'].sudo().search_fetch([
+            ('facility_ids', '=', facility_id),
+            ('quantity_available', '>', 0),
+            ('active', '=', True)
+        ], ['name', 'rental_rate', 'quantity_available', 'company_id'])
+        
+        # Get current user's partner if logged in
+        user = request.env.user
+        partner = user.partner_id if not user._is_public() else False
+        
+        # Prepare values for template
+        values = {
+            'facility': facility,
+            'equipment': equipment,
+            'partner': partner,
+            'page_name': f'Book {facility.name}',
+        }
+        
+        return request.render('sports_booking.booking_form_template', values)
 
     @http.route('/sports/check_availability', type='json', auth='public', methods=['POST'], csrf=False)
     def check_availability(self, facility_id, date, **kwargs):
@@ -230,91 +269,91 @@ class SportsBookingController(http.Controller):
         :param date: Date string in format 'YYYY-MM-DD'
         :return: JSON dict with available time slots
         """
+        # Validate inputs
+        if not facility_id or not date:
+            return {
+                'success': False,
+                'error': 'Missing required parameters: facility_id and date'
+            }
+        
+        # Parse date and facility ID
         try:
-            # Validate inputs
-            if not facility_id or not date:
-                return {
-                    'success': False,
-                    'error': 'Missing required parameters: facility_id and date'
-                }
-            
-            # Parse date
-            try:
-                booking_date = datetime.strptime(date, '%Y-%m-%d').date()
-            except ValueError:
-                return {
-                    'success': False,
-                    'error': 'Invalid date format. Use YYYY-MM-DD'
-                }
-            
-            # Fetch facility
-            facility = request.env['sports.facility'].sudo().browse(int(facility_id))
-            
-            if not facility.exists():
-                return {
-                    'success': False,
-                    'error': 'Facility not found'
-                }
-            
-            # Get facility operating hours
-            operating_start = facility.operating_hours_start
-            operating_end = facility.operating_hours_end
-            
-            # Get existing bookings for this facility on this date
-            start_datetime = datetime.combine(booking_date, datetime.min.time())
-            end_datetime = datetime.combine(booking_date, datetime.max.time())
-            
-            existing_bookings = request.env['sports.booking'].sudo().search([
-                ('facility_id', '=', facility_id),
-                ('status', 'in', ['draft', 'confirmed']),
-                ('start_datetime', '>=', start_datetime),
-                ('start_datetime', '<=', end_datetime)
-            ])
-            
-            # Generate available time slots (1-hour intervals)
-            available_slots = []
-            current_hour = int(operating_start)
-            end_hour = int(operating_end)
-            
-            while current_hour < end_hour:
-                slot_start = current_hour
-                slot_end = current_hour + 1
-                
-                # Check if this slot conflicts with any booking
-                slot_start_dt = datetime.combine(booking_date, datetime.min.time().replace(hour=int(slot_start)))
-                slot_end_dt = datetime.combine(booking_date, datetime.min.time().replace(hour=int(slot_end)))
-                
-                is_available = True
-                for booking in existing_bookings:
-                    if (booking.start_datetime < slot_end_dt and booking.end_datetime > slot_start_dt):
-                        is_available = False
-                        break
-                
-                if is_available:
-                    available_slots.append({
-                        'start': f"{int(slot_start):02d}:00",
-                        'end': f"{int(slot_end):02d}:00",
-                        'start_hour': slot_start,
-                        'end_hour': slot_end
-                    })
-                
-                current_hour += 1
-            
+            booking_date = _parse_dt(date, '%Y-%m-%d').date()
+            facility_id = int(facility_id)
+        except (ValueError, TypeError):
             return {
-                'success': True,
-                'facility_name': facility.name,
-                'date': date,
-                'available_slots': available_slots,
-                'hourly_rate': facility.hourly_rate,
-                'currency': facility.currency_id.symbol if facility.currency_id else '$'
+                'success': False,
+                'error': 'Invalid parameters. Use a numeric facility_id and a YYYY-MM-DD date'
             }
-            
-        except Exception as e:
-            _logger.error('Error checking availability: %s', str(e))
+        
+        # Fetch facility with every field used below in a single query
+        facility = request.env['sports.facility'].sudo().search_fetch(
+            [('id', '=', facility_id)],
+            ['name', 'operating_hours_start', 'operating_hours_end', 'hourly_rate', 'currency_id'],
+            limit=1
+        )
+        
+        if not facility:
             return {
                 'success': False,
-                'error': f'An error occurred: {str(e)}'
+                'error': 'Facility not found'
             }
+        
+        # Get facility operating hours
+        operating_start = facility.operating_hours_start
+        operating_end = facility.operating_hours_end
+        
+        # Generate available time slots (1-hour intervals)
+        available_slots = []
+        start_hour = int(operating_start)
+        end_hour = int(operating_end)
+
+        if start_hour < end_hour:
+            midnight = datetime.combine(booking_date, time.min)
+            first_slot = midnight + timedelta(hours=start_hour)
+            last_slot = midnight + timedelta(hours=end_hour - 1)
+
+            # Let PostgreSQL expand the hourly slots and drop the ones that
+            # overlap an active booking in a single range query
+            request.env['sports.booking'].flush_model([
+                'facility_id', 'status', 'start_datetime', 'end_datetime', 'active'
+            ])
+            request.env.cr.execute("""
+                WITH slots AS (
+                    SELECT generate_series(%s::timestamp, %s::timestamp, interval '1 hour') AS slot_start
+                )
+                SELECT slot_start
+                  FROM slots
+                 WHERE NOT EXISTS (
+                        SELECT 1
+                          FROM sports_booking b
+                         WHERE b.facility_id = %s
+                           AND b.status IN ('draft', 'confirmed')
+                           AND b.active
+                           AND tsrange(b.start_datetime, b.end_datetime, '[)')
+                               && tsrange(slot_start, slot_start + interval '1 hour', '[)')
+                       )
+              ORDER BY slot_start
+            """, (first_slot, last_slot, facility.id))
+
+            for (slot_start_dt,) in request.env.cr.fetchall():
+                slot_start = slot_start_dt.hour
+                slot_end = slot_start + 1
+                available_slots.append({
+                    'start': f"{slot_start:02d}:00",
+                    'end': f"{slot_end:02d}:00",
+                    'start_hour': slot_start,
+                    'end_hour': slot_end
+                })
+
+        return {
+            'success': True,
+            'facility_name': facility.name,
+            'date': date,
+            'available_slots': available_slots,
+            'hourly_rate': facility.hourly_rate,
+            'currency': facility.currency_id.symbol if facility.currency_id else '$'
+        }
 
     @http.route('/sports/confirm_booking', type='http', auth='user', methods=['POST'], website=True, csrf=True)
     def confirm_booking(self, **post):
@@ -325,96 +364,104 @@ class SportsBookingController(http.Controller):
         :param post: Form data dictionary
         :return: Redirect to booking confirmation page or error page
         """
+        # Validate required fields
+        required_fields = ['facility_id', 'start_datetime', 'end_datetime']
+        missing_fields = [field for field in required_fields if not post.get(field)]
+        
+        if missing_fields:
+            return request.render('sports_booking.booking_error_template', {
+                'error': f"Missing required fields: {', '.join(missing_fields)}"
+            })
+        
+        # Parse form data
         try:
-            # Validate required fields
-            required_fields = ['facility_id', 'start_datetime', 'end_datetime']
-            missing_fields = [field for field in required_fields if not post.get(field)]
-            
-            if missing_fields:
-                return request.render('sports_booking.booking_error_template', {
-                    'error': f"Missing required fields: {', '.join(missing_fields)}"
-                })
-            
-            # Parse form data
             facility_id = int(post.get('facility_id'))
-            start_datetime_str = post.get('start_datetime')
-            end_datetime_str = post.get('end_datetime')
-            equipment_ids = post.get('equipment_ids', '')
-            notes = post.get('notes', '')
-            
-            # Parse datetimes
+        except ValueError:
+            return request.render('sports_booking.booking_error_template', {
+                'error': 'Invalid facility'
+            })
+        start_datetime_str = post.get('start_datetime')
+        end_datetime_str = post.get('end_datetime')
+        equipment_ids = post.get('equipment_ids', '')
+        notes = post.get('notes', '')
+        
+        # Parse datetimes
+        try:
+            start_datetime = _parse_dt(start_datetime_str, '%Y-%m-%d %H:%M:%S')
+            end_datetime = _parse_dt(end_datetime_str, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
             try:
-                start_datetime = datetime.strptime(start_datetime_str, '%Y-%m-%d %H:%M:%S')
-                end_datetime = datetime.strptime(end_datetime_str, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                try:
-                    # Try alternative format
-                    start_datetime = datetime.strptime(start_datetime_str, '%Y-%m-%dT%H:%M')
-                    end_datetime = datetime.strptime(end_datetime_str, '%Y-%m-%dT%H:%M')
-                except ValueError as e:
-                    return request.render('sports_booking.booking_error_template', {
-                        'error': f'Invalid datetime format: {str(e)}'
-                    })
-            
-            # Validate datetime logic
-            if end_datetime <= start_datetime:
+                # Try alternative format
+                start_datetime = _parse_dt(start_datetime_str, '%Y-%m-%dT%H:%M')
+                end_datetime = _parse_dt(end_datetime_str, '%Y-%m-%dT%H:%M')
+            except ValueError as e:
                 return request.render('sports_booking.booking_error_template', {
-                    'error': 'End time must be after start time'
+                    'error': f'Invalid datetime format: {str(e)}'
                 })
-            
-            # Parse equipment IDs if provided
-            equipment_id_list = []
-            if equipment_ids:
-                try:
-                    # Handle comma-separated or JSON array
-                    if isinstance(equipment_ids, str):
-                        if equipment_ids.startswith('['):
-                            equipment_id_list = json.loads(equipment_ids)
-                        else:
-                            equipment_id_list = [int(x.strip()) for x in equipment_ids.split(',') if x.strip()]
-                except (ValueError, json.JSONDecodeError) as e:
-                    _logger.warning('Error parsing equipment IDs: %s', str(e))
-            
-            # Get current user's partner
-            customer = request.env.user.partner_id
-            
-            # Prepare booking values
-            booking_vals = {
-                'facility_id': facility_id,
-                'customer_id': customer.id,
-                'start_datetime': start_datetime,
-                'end_datetime': end_datetime,
-                'notes': notes,
-                'status': 'draft',
-            }
-            
-            # Add equipment if provided
-            if equipment_id_list:
-                booking_vals['equipment_ids'] = [(6, 0, equipment_id_list)]
-            
-            # Create booking record
+        
+        # Validate datetime logic
+        if end_datetime <= start_datetime:
+            return request.render('sports_booking.booking_error_template', {
+                'error': 'End time must be after start time'
+            })
+        
+        # Parse equipment IDs if provided (JSON array or comma-separated list)
+        equipment_id_list = []
+        if equipment_ids:
             try:
-                booking = request.env['sports.booking'].sudo().create(booking_vals)
-                _logger.info('Booking created successfully: %s', booking.booking_reference)
-                
-                # Redirect to booking confirmation page
-                return request.redirect(f'/sports/booking/confirmation/{booking.id}')
-                
-            except ValidationError as ve:
-                _logger.warning('Validation error creating booking: %s', str(ve))
-                return request.render('sports_booking.booking_error_template', {
-                    'error': str(ve)
-                })
-            except Exception as e:
-                _logger.error('Error creating booking: %s', str(e))
+                equipment_id_list = (
+                    [int(x) for x in json.loads(equipment_ids)] if equipment_ids.lstrip().startswith('[')
+                    else [int(x) for x in _ID_PATTERN.findall(equipment_ids)]
+                )
+            except (json.JSONDecodeError, TypeError, ValueError) as e:
+                _logger.warning('Error parsing equipment IDs: %s', str(e))
+        
+        # Reject equipment that does not exist instead of failing on the foreign key
+        if equipment_id_list:
+            existing_equipment = request.env['sports.equipment'].sudo().browse(equipment_id_list).exists()
+            if len(existing_equipment) != len(set(equipment_id_list)):
                 return request.render('sports_booking.booking_error_template', {
-                    'error': 'An error occurred while creating your booking. Please try again.'
+                    'error': 'Invalid equipment'
                 })
+        
+        # Get current user's partner
+        partner_id = request.env.user.partner_id.id
+        
+        # Prepare booking values
+        booking_vals = {
+            'facility_id': facility_id,
+            'customer_id': partner_id,
+            'start_datetime': start_datetime,
+            'end_datetime': end_datetime,
+            'notes': notes,
+            'status': 'draft',
+        }
+        
+        # Add equipment if provided
+        if equipment_id_list:
+            booking_vals['equipment_ids'] = [(6, 0, equipment_id_list)]
+        
+        # Create booking record; the savepoint keeps the transaction usable for
+        # rendering the error page if a database constraint rejects the row
+        try:
+            with request.env.cr.savepoint():
+                booking = request.env['sports.booking'].sudo().create(booking_vals)
+            _logger.info('Booking created successfully: %s', booking.booking_reference)
             
-        except Exception as e:
-            _logger.error('Error in confirm_booking: %s', str(e))
+            # Redirect to booking confirmation page
+            return request.redirect(f'/sports/booking/confirmation/{booking.id}')
+            
+        except ValidationError as ve:
+            _logger.warning('Validation error creating booking: %s', str(ve))
+            return request.render('sports_booking.booking_error_template', {
+                'error': str(ve)
+            })
+        except psycopg2.errors.ExclusionViolation as e:
+            # A concurrent booking took the slot between the availability check
+            # and the INSERT (no_overlapping_bookings constraint)
+            _logger.warning('Overlap constraint rejected booking: %s', str(e))
             return request.render('sports_booking.booking_error_template', {
-                'error': 'An unexpected error occurred. Please contact support.'
+                'error': 'This time slot is no longer available. Please choose a different time.'
             })
 
     @http.route('/sports/booking/confirmation/<int:booking_id>', type='http', auth='user', website=True)
@@ -425,26 +472,27 @@ class SportsBookingController(http.Controller):
         :param booking_id: ID of the created booking
         :return: Rendered confirmation template
         """
-        try:
-            # Fetch booking
-            booking = request.env['sports.booking'].sudo().search([
-                ('id', '=', booking_id),
-                ('customer_id', '=', request.env.user.partner_id.id)
-            ], limit=1)
-            
-            if not booking:
-                return request.render('website.404')
-            
-            values = {
-                'booking': booking,
-                'page_name': 'Booking Confirmation',
-            }
-            
-            return request.render('sports_booking.booking_confirmation_template', values)
-            
-        except Exception as e:
-            _logger.error('Error loading booking confirmation: %s', str(e))
+        partner_id = request.env.user.partner_id.id
+        
+        # Make sure the booking belongs to the current user before loading it
+        Booking = request.env['sports.booking'].sudo()
+        owns_booking = Booking.search_count([
+            ('id', '=', booking_id),
+            ('customer_id', '=', partner_id)
+        ], limit=1)
+        
+        if not owns_booking:
             return request.render('website.404')
+        
+        # Fields are prefetched together on first access from the template
+        booking = Booking.browse(booking_id)
+        
+        values = {
+            'booking': booking,
+            'page_name': 'Booking Confirmation',
+        }
+        
+        return request.render('sports_booking.booking_confirmation_template', values)
 
     @http.route('/sports/my/bookings', type='http', auth='user', website=True)
     def my_bookings(self, **kwargs):
@@ -453,22 +501,22 @@ class SportsBookingController(http.Controller):
         
         :return: Rendered template with user's bookings
         """
-        try:
-            # Fetch user's bookings
-            bookings = request.env['sports.booking'].sudo().search([
-                ('customer_id', '=', request.env.user.partner_id.id)
-            ], order='start_datetime desc')
-            
-            values = {
-                'bookings': bookings,
-                'page_name': 'My Bookings',
-            }
-            
-            return request.render('sports_booking.my_bookings_template', values)
-            
-        except Exception as e:
-            _logger.error('Error loading user bookings: %s', str(e))
-            return request.render('website.404')
+        partner_id = request.env.user.partner_id.id
+        
+        # Fetch user's bookings
+        bookings = request.env['sports.booking'].sudo().search_fetch([
+            ('customer_id', '=', partner_id)
+        ], [
+            'booking_reference', 'facility_id', 'start_datetime', 'end_datetime',
+            'duration', 'status', 'total_cost', 'currency_id',
+        ], order='start_datetime desc')
+        
+        values = {
+            'bookings': bookings,
+            'page_name': 'My Bookings',
+        }
+        
+        return request.render('sports_booking.my_bookings_template', values)
     
     @http.route('/sports/checkin/<string:booking_reference>', type='http', auth='public', website=True)
     def checkin_booking(self, booking_reference, **kwargs):
@@ -2,10 +2,13 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
+from collections import Counter, defaultdict
 from datetime import timedelta
+from urllib.parse import urlencode
 from dateutil.relativedelta import relativedelta
 from odoo.tools import float_round
-import pytz
+from odoo.tools.sql import create_index
+import psycopg2
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -28,11 +31,21 @@ class SportsBooking(models.Model):
         help='Auto-generated booking reference number'
     )
     
+    display_name = fields.Char(
+        string='Display Name',
+        compute='_compute_display_name',
+        store=True,
+        index=True,
+        help='Booking reference and facility name, stored so list views and '
+             'many2one widgets do not rebuild it on every read'
+    )
+    
     facility_id = fields.Many2one(
         'sports.facility',
         string='Facility',
         required=True,
         ondelete='restrict',
+        index=True,
         tracking=True,
         help='The facility being booked'
     )
@@ -42,6 +55,7 @@ class SportsBooking(models.Model):
         string='Customer',
         required=True,
         ondelete='restrict',
+        index='btree_not_null',
         tracking=True,
         help='Customer making the booking'
     )
@@ -49,6 +63,7 @@ class SportsBooking(models.Model):
     start_datetime = fields.Datetime(
         string='Start Date & Time',
         required=True,
+        index=True,
         tracking=True,
         help='Booking start date and time'
     )
@@ -56,6 +71,7 @@ class SportsBooking(models.Model):
     end_datetime = fields.Datetime(
         string='End Date & Time',
         required=True,
+        index=True,
         tracking=True,
         help='Booking end date and time'
     )
@@ -67,6 +83,29 @@ class SportsBooking(models.Model):
         help='Duration of the booking in hours'
     )
     
+    facility_cost = fields.Float(
+        string='Facility Cost',
+        compute='_compute_facility_cost',
+        store=True,
+        digits='Product Price',
+        help='Facility hourly rate multiplied by the booking duration'
+    )
+    
+    equipment_cost = fields.Float(
+        string='Equipment Cost',
+        compute='_compute_equipment_cost',
+        store=True,
+        digits='Product Price',
+        help='Sum of the equipment rental rates multiplied by the booking duration'
+    )
+    
+    discount_percentage = fields.Float(
+        string='Membership Discount (%)',
+        compute='_compute_discount_percentage',
+        store=True,
+        help='Discount of the paid active membership of the customer at the booking date'
+    )
+    
     total_cost = fields.Float(
         string='Total Cost',
         compute='_compute_total_cost',
@@ -81,9 +120,19 @@ class SportsBooking(models.Model):
         ('in_progress', 'In Progress'),
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
-    ], string='Status', default='draft', required=True, tracking=True,
+    ], string='Status', default='draft', required=True, index='btree_not_null',
+       tracking=True,
        help='Current status of the booking')
     
+    reminder_sent = fields.Boolean(
+        string='Reminder Sent',
+        compute='_compute_reminder_sent',
+        store=True,
+        readonly=False,
+        copy=False,
+        help='Set once the reminder email has been queued; reset when the booking is rescheduled'
+    )
+    
     checkin_datetime = fields.Datetime(
         string='Check-in Time',
         readonly=True,
@@ -165,85 +214,216 @@ class SportsBooking(models.Model):
         readonly=True
     )
 
+    _sql_constraints = [
+        ('no_overlapping_bookings',
+         "EXCLUDE USING gist (facility_id WITH =, tsrange(start_datetime, end_datetime, '[)') WITH &&) "
+         "WHERE (status IN ('draft', 'confirmed') AND active)",
+         'This facility is already booked for an overlapping time period!'),
+        ('end_after_start',
+         'CHECK(end_datetime > start_datetime)',
+         'Invalid booking dates: End date and time must be after start date and time.'),
+    ]
+
+    def _auto_init(self):
+        # Equality on facility_id inside the GiST exclusion constraint requires btree_gist
+        try:
+            with self.env.cr.savepoint():
+                self.env.cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        except psycopg2.Error as e:
+            _logger.warning('Could not enable btree_gist, overlap exclusion constraint unavailable: %s', str(e))
+        return super()._auto_init()
+
+    def init(self):
+        super().init()
+        # Composite index matching the overlap probes, which only consider
+        # active draft/confirmed bookings
+        create_index(
+            self.env.cr,
+            'sports_booking_overlap_idx',
+            self._table,
+            ['facility_id', 'start_datetime', 'end_datetime'],
+            where="status IN ('draft', 'confirmed') AND active",
+        )
+        # Equality on status then a range on start_datetime, as used by the reminder cron
+        create_index(
+            self.env.cr,
+            'sports_booking_status_start_idx',
+            self._table,
+            ['status', 'start_datetime'],
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Check dates and availability before the INSERT, see _check_booking_dates
+        # and _check_periods_available; values missing from vals come from the
+        # defaults (e.g. default_facility_id in the context)
+        defaults = self.default_get(['facility_id', 'start_datetime', 'end_datetime', 'status', 'active'])
+        merged_vals_list = [{**defaults, **vals} for vals in vals_list]
+        self._check_booking_dates([
+            (
+                fields.Datetime.to_datetime(vals.get('start_datetime')),
+                fields.Datetime.to_datetime(vals.get('end_datetime')),
+            )
+            for vals in merged_vals_list
+        ])
+        
+        new_reference = _('New')
+        needing_reference = [
+            vals for vals in vals_list
+            if vals.get('booking_reference', new_reference) == new_reference
+        ]
+        if needing_reference:
+            references = self._next_booking_references(len(needing_reference))
+            for vals, reference in zip(needing_reference, references):
+                vals['booking_reference'] = reference or new_reference
+        
+        self._check_periods_available([
+            (
+                0,
+                merged_vals.get('facility_id'),
+                fields.Datetime.to_datetime(merged_vals.get('start_datetime')),
+                fields.Datetime.to_datetime(merged_vals.get('end_datetime')),
+                vals['booking_reference'],
+            )
+            for vals, merged_vals in zip(vals_list, merged_vals_list)
+            if merged_vals.get('status', 'draft') in ('draft', 'confirmed') and merged_vals.get('active', True)
+        ])
+        return super(SportsBooking, self).create(vals_list)
+
+    def write(self, vals):
+        # Check dates and availability before the UPDATE is flushed, see
+        # _check_booking_dates and _check_periods_available
+        if {'start_datetime', 'end_datetime'} & vals.keys():
+            self._check_booking_dates([
+                (
+                    fields.Datetime.to_datetime(vals['start_datetime']) if 'start_datetime' in vals
+                    else record.start_datetime,
+                    fields.Datetime.to_datetime(vals['end_datetime']) if 'end_datetime' in vals
+                    else record.end_datetime,
+                )
+                for record in self
+            ])
+        if {'facility_id', 'start_datetime', 'end_datetime'} & vals.keys():
+            self._check_periods_available(self._get_periods(vals))
+        elif {'status', 'active'} & vals.keys():
+            # Only bookings starting to occupy their facility again (e.g. cancelled
+            # -> draft, unarchived) can conflict; draft -> confirmed cannot
+            released = self.filtered(lambda b: not b.active or b.status not in ('draft', 'confirmed'))
+            released._check_periods_available(released._get_periods(vals))
+        return super(SportsBooking, self).write(vals)
+
     @api.model
-    def create(self, vals):
-        if vals.get('booking_reference', _('New')) == _('New'):
-            vals['booking_reference'] = self.env['ir.sequence'].next_by_code('sports.booking') or _('New')
-        return super(SportsBooking, self).create(vals)
+    def _next_booking_references(self, count):
+        """
+        Allocate several booking references with a single round trip.
+        Standard (no gap-free, no date range) sequences are backed by a
+        PostgreSQL sequence, so all numbers can be drawn in one query;
+        other configurations fall back to next_by_code per reference.
+        
+        :param count: Number of references to allocate
+        :return: list of formatted references
+        """
+        Sequence = self.env['ir.sequence']
+        # Same sequence next_by_code would pick for the current company
+        sequence = Sequence.search([
+            ('code', '=', 'sports.booking'),
+            ('company_id', 'in', [self.env.company.id, False]),
+        ], order='company_id', limit=1)
+        if count == 1 or not sequence or sequence.implementation != 'standard' or sequence.use_date_range:
+            return [Sequence.next_by_code('sports.booking') for _i in range(count)]
+        
+        self.env.cr.execute(
+            "SELECT nextval(%s) FROM generate_series(1, %s)",
+            ('ir_sequence_%03d' % sequence.id, count)
+        )
+        return [sequence.get_next_char(number) for (number,) in self.env.cr.fetchall()]
 
     @api.depends('start_datetime', 'end_datetime')
     def _compute_duration(self):
         """
         Calculate hours between start_datetime and end_datetime.
-        Handles timezone conversions properly to ensure accurate duration calculation.
+        Both values are stored as naive UTC, so their difference is the
+        elapsed time whatever the user's timezone.
         The field is stored in the database for performance optimization.
         """
+        dated_bookings = self.filtered(lambda b: b.start_datetime and b.end_datetime)
+        (self - dated_bookings).duration = 0.0
+        for record in dated_bookings:
+            delta = record.end_datetime - record.start_datetime
+            
+            # Round to 2 decimal places for precision
+            record.duration = float_round(delta.total_seconds() / 3600.0, precision_digits=2)
+
+    @api.depends('start_datetime')
+    def _compute_reminder_sent(self):
+        """A rescheduled booking needs a new reminder"""
+        self.reminder_sent = False
+
+    @api.depends('duration', 'facility_id.hourly_rate')
+    def _compute_facility_cost(self):
+        """Calculate facility hourly rate * duration"""
         for record in self:
-            if record.start_datetime and record.end_datetime:
-                # Get user timezone or default to UTC
-                tz_name = self.env.user.tz or 'UTC'
-                user_tz = pytz.timezone(tz_name)
-                
-                # Convert datetime to user timezone for accurate calculation
-                # Odoo stores datetime in UTC, so we need to localize properly
-                start_utc = pytz.UTC.localize(record.start_datetime.replace(tzinfo=None))
-                end_utc = pytz.UTC.localize(record.end_datetime.replace(tzinfo=None))
-                
-                # Convert to user timezone
-                start_local = start_utc.astimezone(user_tz)
-                end_local = end_utc.astimezone(user_tz)
-                
-                # Calculate duration in seconds and convert to hours
-                delta = end_local - start_local
-                duration_hours = delta.total_seconds() / 3600.0
-                
-                # Round to 2 decimal places for precision
-                record.duration = float_round(duration_hours, precision_digits=2)
-            else:
-                record.duration = 0.0
+            record.facility_cost = (record.facility_id.hourly_rate or 0.0) * record.duration
+
+    @api.depends('duration', 'equipment_ids')
+    def _compute_equipment_cost(self):
+        """
+        Calculate sum of all equipment rental rates * duration.
+        Rental rate changes are propagated by sports.equipment.write to
+        draft and confirmed bookings only, so past bookings keep their price.
+        """
+        for record in self:
+            record.equipment_cost = sum(record.equipment_ids.mapped('rental_rate')) * record.duration
 
-    @api.depends('duration', 'facility_id', 'facility_id.hourly_rate', 
-                 'equipment_ids', 'equipment_ids.rental_rate',
-                 'customer_id', 'start_datetime')
+    @api.depends('customer_id', 'start_datetime')
+    def _compute_discount_percentage(self):
+        """
+        Find the discount of the customer's active membership at the booking date.
+        Kept apart from the cost so rate or duration changes do not search memberships again.
+        """
+        # Fetch the paid active memberships of all customers covering any of the
+        # booking dates in one search, grouped per customer (newest first)
+        memberships_by_customer = defaultdict(list)
+        dated_bookings = self.filtered(lambda b: b.customer_id and b.start_datetime)
+        if dated_bookings:
+            booking_dates = [booking.start_datetime.date() for booking in dated_bookings]
+            memberships = self.env['sports.membership'].search([
+                ('member_id', 'in', dated_bookings.customer_id.ids),
+                ('status', '=', 'active'),
+                ('start_date', '<=', max(booking_dates)),
+                ('end_date', '>=', min(booking_dates)),
+                ('payment_status', '=', 'paid'),
+            ])
+            for membership in memberships:
+                memberships_by_customer[membership.member_id.id].append(membership)
+        
+        # Bookings without customer or date (e.g. half-filled forms) get no discount
+        (self - dated_bookings).discount_percentage = 0.0
+        for record in dated_bookings:
+            # Find active membership for the customer at booking start date
+            booking_date = record.start_datetime.date()
+            active_membership = next((
+                membership for membership in memberships_by_customer[record.customer_id.id]
+                if membership.start_date <= booking_date <= membership.end_date
+            ), None)
+            record.discount_percentage = active_membership.discount_percentage if active_membership else 0.0
+
+    @api.depends('facility_cost', 'equipment_cost', 'discount_percentage')
     def _compute_total_cost(self):
         """
         Calculate total booking cost including:
-        1) Facility hourly rate * duration
-        2) Sum of all equipment rental rates * duration
+        1) Facility cost (hourly rate * duration)
+        2) Equipment cost (sum of rental rates * duration)
         3) Apply membership discount if customer has active membership
         
         The field is stored in database and handles all edge cases.
+        Equipment or facility rate changes only recompute their own part.
         """
         for record in self:
-            total = 0.0
-            
-            # 1) Calculate facility cost (duration * hourly_rate)
-            if record.facility_id and record.duration:
-                facility_rate = record.facility_id.hourly_rate or 0.0
-                total += facility_rate * record.duration
-            
-            # 2) Add equipment rental costs (sum of rental_rates * duration)
-            if record.equipment_ids and record.duration:
-                for equipment in record.equipment_ids:
-                    equipment_rate = equipment.rental_rate or 0.0
-                    total += equipment_rate * record.duration
-            
-            # 3) Apply membership discount if customer has active membership
-            discount_percentage = 0.0
-            if record.customer_id and record.start_datetime:
-                # Find active membership for the customer at booking start date
-                active_membership = self.env['sports.membership'].search([
-                    ('member_id', '=', record.customer_id.id),
-                    ('status', '=', 'active'),
-                    ('start_date', '<=', record.start_datetime.date()),
-                    ('end_date', '>=', record.start_datetime.date()),
-                    ('payment_status', '=', 'paid'),
-                ], limit=1)
-                
-                if active_membership:
-                    discount_percentage = active_membership.discount_percentage or 0.0
+            total = record.facility_cost + record.equipment_cost
             
             # Apply discount to total cost
+            discount_percentage = record.discount_percentage
             if discount_percentage > 0 and total > 0:
                 discount_amount = (total * discount_percentage) / 100.0
                 total = total - discount_amount
@@ -251,161 +431,269 @@ class SportsBooking(models.Model):
             # Ensure total is never negative and round to 2 decimal places
             record.total_cost = float_round(max(0.0, total), precision_digits=2)
 
+    @api.model
+    def _check_booking_dates(self, periods):
+        """
+        Ensure end_datetime is after start_datetime.
+        Called from create and write before the rows reach the database, where
+        the end_after_start constraint (or the tsrange of no_overlapping_bookings)
+        would reject them with a bare database error instead of the offending dates.
+        
+        :param periods: list of (start_datetime, end_datetime)
+        :raises ValidationError: For the first inverted or empty period
+        """
+        for start_datetime, end_datetime in periods:
+            if start_datetime and end_datetime and end_datetime <= start_datetime:
+                raise ValidationError(_(
+                    'Invalid booking dates: End date and time must be after start date and time.\n'
+                    'Start: %s\n'
+                    'End: %s'
+                ) % (start_datetime, end_datetime))
+
     @api.constrains('start_datetime', 'end_datetime')
     def validate_booking_dates(self):
-        """Ensure end_datetime is after start_datetime"""
+        """
+        Ensure end_datetime is after start_datetime.
+        Backstop for the checks done in create and write before the database.
+        """
+        self._check_booking_dates([(record.start_datetime, record.end_datetime) for record in self])
+
+    def _get_periods(self, vals=None):
+        """
+        Periods occupied by the bookings, optionally once ``vals`` are written.
+        Only active draft and confirmed bookings occupy their facility.
+        
+        :param vals: values about to be written on the bookings
+        :return: list of (booking ID, facility ID, start_datetime, end_datetime, booking reference)
+        """
+        vals = vals or {}
+        periods = []
         for record in self:
-            if record.start_datetime and record.end_datetime:
-                if record.end_datetime <= record.start_datetime:
-                    raise ValidationError(_(
-                        'Invalid booking dates: End date and time must be after start date and time.\n'
-                        'Start: %s\n'
-                        'End: %s'
-                    ) % (record.start_datetime, record.end_datetime))
+            status = vals.get('status', record.status)
+            active = vals.get('active', record.active)
+            if status not in ('draft', 'confirmed') or not active:
+                continue
+            periods.append((
+                record.id,
+                vals['facility_id'] if 'facility_id' in vals else record.facility_id.id,
+                fields.Datetime.to_datetime(vals['start_datetime']) if 'start_datetime' in vals
+                else record.start_datetime,
+                fields.Datetime.to_datetime(vals['end_datetime']) if 'end_datetime' in vals
+                else record.end_datetime,
+                record.booking_reference,
+            ))
+        return periods
+
+    @api.model
+    def _find_overlapping_periods(self, periods):
+        """
+        Find the first active booking overlapping each period, with a single
+        query for the stored bookings plus a sweep over the periods themselves.
+        The stored rows of the bookings being checked are ignored, as they
+        are about to be replaced by their period.
+        
+        :param periods: list of (booking ID or 0, facility ID, start_datetime, end_datetime, reference)
+        :return: dict mapping the index of the period to (booking_reference, start_datetime,
+                 end_datetime) of the conflicting booking
+        """
+        rows = [
+            (index, facility_id, start_datetime, end_datetime)
+            for index, (_id, facility_id, start_datetime, end_datetime, _ref) in enumerate(periods)
+            # Inverted periods are rejected by _check_booking_dates and cannot form a range
+            if facility_id and start_datetime and end_datetime and start_datetime < end_datetime
+        ]
+        if not rows:
+            return {}
+        
+        # Periods of the same batch conflicting with each other
+        conflicts = {}
+        rows_by_facility = defaultdict(list)
+        for index, facility_id, start_datetime, end_datetime in rows:
+            rows_by_facility[facility_id].append((start_datetime, end_datetime, index))
+        for facility_rows in rows_by_facility.values():
+            latest_end = latest_index = None
+            for start_datetime, end_datetime, index in sorted(facility_rows):
+                if latest_end and start_datetime < latest_end:
+                    other = periods[latest_index]
+                    conflicts[index] = (other[4], other[2], other[3])
+                if not latest_end or end_datetime > latest_end:
+                    latest_end, latest_index = end_datetime, index
+        
+        self.flush_model([
+            'facility_id', 'status', 'start_datetime', 'end_datetime', 'active', 'booking_reference'
+        ])
+        values_sql = ', '.join(['(%s, %s, %s::timestamp, %s::timestamp)'] * len(rows))
+        params = [value for row in rows for value in row]
+        params.append([period[0] for period in periods if period[0]])
+        self.env.cr.execute(f"""
+            SELECT DISTINCT ON (v.period) v.period, b.booking_reference, b.start_datetime, b.end_datetime
+              FROM (VALUES {values_sql}) AS v(period, facility_id, start_datetime, end_datetime)
+              JOIN sports_booking b
+                ON b.facility_id = v.facility_id
+               AND b.active
+               AND b.status IN ('draft', 'confirmed')
+               AND tsrange(b.start_datetime, b.end_datetime, '[)')
+                   && tsrange(v.start_datetime, v.end_datetime, '[)')
+             WHERE b.id <> ALL(%s::int[])
+          ORDER BY v.period, b.start_datetime
+        """, params)
+        for index, *conflict in self.env.cr.fetchall():
+            conflicts.setdefault(index, tuple(conflict))
+        return conflicts
+
+    def _get_overlapping_bookings(self):
+        """
+        Find, in a single query, the first active booking overlapping each record.
+
+        :return: dict mapping record id to (booking_reference, start_datetime, end_datetime)
+                 of the conflicting booking
+        """
+        periods = self._get_periods()
+        return {
+            periods[index][0]: conflict
+            for index, conflict in self._find_overlapping_periods(periods).items()
+        }
+
+    @api.model
+    def _check_periods_available(self, periods):
+        """
+        Prevent double booking by checking overlapping bookings for same facility.
+        Called from create and write before the rows reach the database, where
+        the no_overlapping_bookings constraint would reject them with a bare
+        IntegrityError instead of naming the conflicting booking.
+        
+        :param periods: list of (booking ID or 0, facility ID, start_datetime, end_datetime, reference)
+        :raises ValidationError: For the first period conflicting with an active booking
+        """
+        conflicts = self._find_overlapping_periods(periods)
+        if conflicts:
+            index = min(conflicts)
+            reference, start_datetime, end_datetime = conflicts[index]
+            raise ValidationError(_(
+                'Facility "%s" is not available for the selected time period.\n\n'
+                'Conflicting booking: %s\n'
+                'Time: %s to %s\n\n'
+                'Please choose a different time slot or facility.'
+            ) % (
+                self.env['sports.facility'].browse(periods[index][1]).name,
+                reference,
+                start_datetime,
+                end_datetime
+            ))
 
-    @api.constrains('start_datetime', 'end_datetime', 'facility_id', 'status')
+    @api.constrains('start_datetime', 'end_datetime', 'facility_id', 'status', 'active')
     def check_facility_availability(self):
-        """Prevent double booking by checking overlapping bookings for same facility"""
-        for record in self:
-            if record.facility_id and record.start_datetime and record.end_datetime:
-                # Only check for active bookings (not cancelled)
-                overlapping = self.search([
-                    ('id', '!=', record.id),
-                    ('facility_id', '=', record.facility_id.id),
-                    ('status', 'in', ['draft', 'confirmed']),
-                    ('start_datetime', '<', record.end_datetime),
-                    ('end_datetime', '>', record.start_datetime),
-                ])
-                if overlapping:
-                    overlapping_booking = overlapping[0]
-                    raise ValidationError(_(
-                        'Facility "%s" is not available for the selected time period.\n\n'
-                        'Conflicting booking: %s\n'
-                        'Time: %s to %s\n\n'
-                        'Please choose a different time slot or facility.'
-                    ) % (
-                        record.facility_id.name,
-                        overlapping_booking.booking_reference,
-                        overlapping_booking.start_datetime,
-                        overlapping_booking.end_datetime
-                    ))
+        """
+        Prevent double booking by checking overlapping bookings for same facility.
+        Backstop for the checks done in create and write before the database.
+        """
+        self._check_periods_available(self._get_periods())
 
     @api.constrains('start_datetime', 'end_datetime', 'facility_id')
     def validate_operating_hours(self):
         """Ensure booking times are within facility operating hours"""
+        # Load the operating hours of every facility involved in one query
+        self.facility_id.fetch(['name', 'operating_hours_start', 'operating_hours_end'])
         for record in self:
             if record.facility_id and record.start_datetime and record.end_datetime:
-                # Extract time from datetime
-                start_time = record.start_datetime.hour + record.start_datetime.minute / 60.0
-                end_time = record.end_datetime.hour + record.end_datetime.minute / 60.0
+                facility = record.facility_id
+                operating_start = facility.operating_hours_start
+                operating_end = facility.operating_hours_end
                 
-                operating_start = record.facility_id.operating_hours_start
-                operating_end = record.facility_id.operating_hours_end
+                # Compare in whole minutes since midnight; for multi-day bookings
+                # this checks the first and last day, exactly like a single-day booking
+                start_minutes = record.start_datetime.hour * 60 + record.start_datetime.minute
+                end_minutes = record.end_datetime.hour * 60 + record.end_datetime.minute
+                operating_start_minutes = round(operating_start * 60)
+                operating_end_minutes = round(operating_end * 60)
                 
-                # Check if booking is on the same day
-                if record.start_datetime.date() == record.end_datetime.date():
-                    # Single day booking
-                    if start_time < operating_start:
-                        raise ValidationError(_(
-                            'Booking start time (%02d:%02d) is before facility operating hours.\n'
-                            'Facility "%s" opens at %02d:%02d.'
-                        ) % (
-                            record.start_datetime.hour,
-                            record.start_datetime.minute,
-                            record.facility_id.name,
-                            int(operating_start),
-                            int((operating_start % 1) * 60)
-                        ))
-                    
-                    if end_time > operating_end:
-                        raise ValidationError(_(
-                            'Booking end time (%02d:%02d) is after facility operating hours.\n'
-                            'Facility "%s" closes at %02d:%02d.'
-                        ) % (
-                            record.end_datetime.hour,
-                            record.end_datetime.minute,
-                            record.facility_id.name,
-                            int(operating_end),
-                            int((operating_end % 1) * 60)
-                        ))
-                else:
-                    # Multi-day booking - check first and last day
-                    if start_time < operating_start:
-                        raise ValidationError(_(
-                            'Booking start time (%02d:%02d) is before facility operating hours.\n'
-                            'Facility "%s" opens at %02d:%02d.'
-                        ) % (
-                            record.start_datetime.hour,
-                            record.start_datetime.minute,
-                            record.facility_id.name,
-                            int(operating_start),
-                            int((operating_start % 1) * 60)
-                        ))
-                    
-                    if end_time > operating_end:
-                        raise ValidationError(_(
-                            'Booking end time (%02d:%02d) is after facility operating hours.\n'
-                            'Facility "%s" closes at %02d:%02d.'
-                        ) % (
-                            record.end_datetime.hour,
-                            record.end_datetime.minute,
-                            record.facility_id.name,
-                            int(operating_end),
-                            int((operating_end % 1) * 60)
-                        ))
+                if start_minutes < operating_start_minutes:
+                    raise ValidationError(_(
+                        'Booking start time (%02d:%02d) is before facility operating hours.\n'
+                        'Facility "%s" opens at %02d:%02d.'
+                    ) % (
+                        record.start_datetime.hour,
+                        record.start_datetime.minute,
+                        facility.name,
+                        *divmod(operating_start_minutes, 60)
+                    ))
+                
+                if end_minutes > operating_end_minutes:
+                    raise ValidationError(_(
+                        'Booking end time (%02d:%02d) is after facility operating hours.\n'
+                        'Facility "%s" closes at %02d:%02d.'
+                    ) % (
+                        record.end_datetime.hour,
+                        record.end_datetime.minute,
+                        facility.name,
+                        *divmod(operating_end_minutes, 60)
+                    ))
+
+    def _log_status_change(self, body):
+        """
+        Log a status change in the chatter of every booking in one batch.
+        The action methods write the status with mail_notrack and log through
+        here instead of creating one tracking message per record; other
+        status writes (check-in, imports) are still tracked.
+        
+        :param body: Message to log on each booking
+        """
+        self._message_log_batch(bodies={record.id: body for record in self})
+
+    def _get_equipment_quantities(self):
+        """
+        Count the equipment units used by the bookings, one per booking
+        
+        :return: dict mapping equipment ID to the number of units
+        """
+        return Counter(
+            equipment_id for record in self for equipment_id in record.equipment_ids.ids
+        )
+
+    def _return_equipment(self):
+        """Restore the available quantity of the equipment used by the bookings"""
+        try:
+            self.env['sports.equipment'].return_equipment_bulk(self._get_equipment_quantities())
+        except (UserError, ValidationError) as e:
+            raise ValidationError(_(
+                'Equipment return failed:\n%s'
+            ) % str(e))
 
     def action_confirm(self):
         """
         Confirm the booking:
-        - Validate availability
-        - Set status to 'confirmed'
+        - Set status to 'confirmed' (availability is enforced by
+          create/write, check_facility_availability and the no_overlapping_bookings constraint)
         - Decrease equipment quantity_available for each equipment
         - Send confirmation email using mail template
         """
+        # Validate current status
+        if self.filtered(lambda b: b.status != 'draft'):
+            raise ValidationError(_('Only draft bookings can be confirmed.'))
+        
+        # Checkout equipment - decrease available quantity for all bookings at once
+        try:
+            self.env['sports.equipment'].checkout_equipment_bulk(self._get_equipment_quantities())
+        except (UserError, ValidationError) as e:
+            raise ValidationError(_(
+                'Equipment checkout failed:\n%s'
+            ) % str(e))
+        
+        # Update booking status
+        self.with_context(mail_notrack=True).write({'status': 'confirmed'})
+        self._log_status_change(_('Booking confirmed'))
+        
+        # Confirmation emails are queued and sent by the mail queue cron
+        template = self.env.ref('sport_facility_booking_system.email_template_booking_confirmation', 
+                                raise_if_not_found=False)
+        
         for record in self:
-            # Validate current status
-            if record.status != 'draft':
-                raise ValidationError(_('Only draft bookings can be confirmed.'))
-            
-            # Validate facility availability (double-check)
-            if record.facility_id and record.start_datetime and record.end_datetime:
-                overlapping = self.search([
-                    ('id', '!=', record.id),
-                    ('facility_id', '=', record.facility_id.id),
-                    ('status', 'in', ['draft', 'confirmed']),
-                    ('start_datetime', '<', record.end_datetime),
-                    ('end_datetime', '>', record.start_datetime),
-                ])
-                if overlapping:
-                    raise ValidationError(_(
-                        'Facility is no longer available for this time slot. '
-                        'Please refresh and select a different time.'
-                    ))
-            
-            # Checkout equipment - decrease available quantity
-            equipment_checkout_errors = []
-            for equipment in record.equipment_ids:
-                try:
-                    equipment.checkout_equipment(quantity=1)
-                except Exception as e:
-                    equipment_checkout_errors.append(str(e))
-            
-            if equipment_checkout_errors:
-                raise ValidationError(_(
-                    'Equipment checkout failed:\n%s'
-                ) % '\n'.join(equipment_checkout_errors))
-            
-            # Update booking status
-            record.write({'status': 'confirmed'})
-            
             # Send confirmation email after status change
             try:
-                template = self.env.ref('sport_facility_booking_system.email_template_booking_confirmation', 
-                                       raise_if_not_found=False)
                 if template:
-                    template.send_mail(record.id, force_send=True)
+                    template.send_mail(record.id, force_send=False)
                     _logger.info(
-                        'Booking confirmation email sent successfully for booking %s',
+                        'Booking confirmation email queued for booking %s',
                         record.booking_reference
                     )
             except Exception as e:
@@ -441,26 +729,16 @@ class SportsBooking(models.Model):
         - Set status to 'completed'
         - Restore equipment quantities
         """
-        for record in self:
-            # Validate current status
-            if record.status != 'confirmed':
-                raise ValidationError(_('Only confirmed bookings can be completed.'))
-            
-            # Return equipment - restore available quantity
-            equipment_return_errors = []
-            for equipment in record.equipment_ids:
-                try:
-                    equipment.return_equipment(quantity=1)
-                except Exception as e:
-                    equipment_return_errors.append(str(e))
-            
-            if equipment_return_errors:
-                raise ValidationError(_(
-                    'Equipment return failed:\n%s'
-                ) % '\n'.join(equipment_return_errors))
-            
-            # Update booking status
-            record.write({'status': 'completed'})
+        # Validate current status
+        if self.filtered(lambda b: b.status != 'confirmed'):
+            raise ValidationError(_('Only confirmed bookings can be completed.'))
+        
+        # Return equipment - restore available quantity for all bookings at once
+        self._return_equipment()
+        
+        # Update booking status
+        self.with_context(mail_notrack=True).write({'status': 'completed'})
+        self._log_status_change(_('Booking completed'))
         
         return True
 
@@ -471,37 +749,30 @@ class SportsBooking(models.Model):
         - Restore equipment quantities
         - Handle refund logic
         """
+        # Validate current status
+        if self.filtered(lambda b: b.status == 'completed'):
+            raise ValidationError(_('Completed bookings cannot be cancelled.'))
+        
+        # Return equipment of the bookings that were confirmed
+        self.filtered(lambda b: b.status == 'confirmed')._return_equipment()
+        
+        # Cancellation emails are queued and sent by the mail queue cron
+        template = self.env.ref('sport_facility_booking_system.email_template_booking_cancellation', 
+                                raise_if_not_found=False)
+        
+        # Same reference time for every booking so a batch gets consistent refund tiers
+        now = fields.Datetime.now()
+        
         for record in self:
-            # Validate current status
-            if record.status == 'completed':
-                raise ValidationError(_('Completed bookings cannot be cancelled.'))
-            
             # Store original status for refund calculation
             original_status = record.status
             
-            # Return equipment if booking was confirmed
-            if original_status == 'confirmed':
-                equipment_return_errors = []
-                for equipment in record.equipment_ids:
-                    try:
-                        equipment.return_equipment(quantity=1)
-                    except Exception as e:
-                        equipment_return_errors.append(str(e))
-                
-                if equipment_return_errors:
-                    raise ValidationError(_(
-                        'Equipment return failed:\n%s'
-                    ) % '\n'.join(equipment_return_errors))
-            
             # Calculate refund amount based on cancellation policy
             refund_amount = 0.0
             refund_percentage = 0.0
             
             if original_status == 'confirmed' and record.total_cost > 0:
                 # Calculate hours until booking starts
-                from datetime import datetime
-                now = fields.Datetime.now()
-                
                 if record.start_datetime > now:
                     hours_until_booking = (record.start_datetime - now).total_seconds() / 3600.0
                     
@@ -525,19 +796,17 @@ class SportsBooking(models.Model):
             existing_notes = record.notes or ''
             updated_notes = f"{existing_notes}\n\n{cancellation_note}" if existing_notes else cancellation_note
             
-            record.write({
+            record.with_context(mail_notrack=True).write({
                 'status': 'cancelled',
                 'notes': updated_notes,
             })
             
             # Send cancellation email
             try:
-                template = self.env.ref('sport_facility_booking_system.email_template_booking_cancellation', 
-                                       raise_if_not_found=False)
                 if template:
-                    template.send_mail(record.id, force_send=True)
+                    template.send_mail(record.id, force_send=False)
                     _logger.info(
-                        'Booking cancellation email sent successfully for booking %s',
+                        'Booking cancellation email queued for booking %s',
                         record.booking_reference
                     )
             except Exception as e:
@@ -557,6 +826,7 @@ class SportsBooking(models.Model):
                     record.booking_reference, str(e)
                 )
         
+        self._log_status_change(_('Booking cancelled'))
         return True
     
     def auto_assign_from_waitlist(self):
@@ -606,27 +876,25 @@ class SportsBooking(models.Model):
         waitlist_entry = waiting_customers[0]
         
         # Build pre-filled booking URL parameters
-        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
+        base_url = self.get_base_url()
         booking_url = f"{base_url}/sports/booking/create"
         
         # Add URL parameters for pre-filling the booking form
-        url_params = [
-            f"facility_id={self.facility_id.id}",
-            f"customer_id={waitlist_entry.customer_id.id}",
-            f"date={booking_date.strftime('%Y-%m-%d')}",
-        ]
+        url_params = {
+            'facility_id': self.facility_id.id,
+            'customer_id': waitlist_entry.customer_id.id,
+            'date': booking_date.strftime('%Y-%m-%d'),
+        }
         
         # Add time parameters if available from cancelled booking
         if self.start_datetime:
-            start_time = self.start_datetime.hour + (self.start_datetime.minute / 60.0)
-            url_params.append(f"start_time={start_time}")
+            url_params['start_time'] = self.start_datetime.hour + (self.start_datetime.minute / 60.0)
         
         if self.end_datetime:
-            end_time = self.end_datetime.hour + (self.end_datetime.minute / 60.0)
-            url_params.append(f"end_time={end_time}")
+            url_params['end_time'] = self.end_datetime.hour + (self.end_datetime.minute / 60.0)
         
         # Construct full URL
-        full_booking_url = f"{booking_url}?{'&'.join(url_params)}"
+        full_booking_url = f"{booking_url}?{urlencode(url_params)}"
         
         # Update waitlist entry status
         waitlist_entry.write({
@@ -650,7 +918,7 @@ class SportsBooking(models.Model):
                     'start_time': self.start_datetime.strftime('%H:%M') if self.start_datetime else '',
                     'end_time': self.end_datetime.strftime('%H:%M') if self.end_datetime else '',
                 })
-                template.with_context(ctx).send_mail(waitlist_entry.id, force_send=True)
+                template.with_context(ctx).send_mail(waitlist_entry.id, force_send=False)
             else:
                 # Fallback: send simple email if template doesn't exist
                 mail_values = {
@@ -674,7 +942,8 @@ class SportsBooking(models.Model):
                     'email_to': waitlist_entry.customer_email,
                     'email_from': self.env.user.email or 'noreply@example.com',
                 }
-                self.env['mail.mail'].create(mail_values).send()
+                # Queued like the template mails, sent by the mail queue cron
+                self.env['mail.mail'].create(mail_values)
             
             _logger.info(
                 'Waitlist notification sent to %s for facility %s on %s (booking URL: %s)',
@@ -693,6 +962,84 @@ class SportsBooking(models.Model):
         
         return waitlist_entry
     
+    def _generate_occurrence_datetimes(self):
+        """
+        Compute the start and end of every child occurrence of a recurring booking.
+        The parent booking counts as the first occurrence of recurrence_count.
+        
+        :return: list of (start_datetime, end_datetime) tuples, in chronological order
+        """
+        self.ensure_one()
+        
+        if self.recurrence_type == 'daily':
+            step = timedelta(days=1)
+        elif self.recurrence_type == 'weekly':
+            step = timedelta(days=7)
+        elif self.recurrence_type == 'monthly':
+            step = relativedelta(months=1)
+        else:
+            raise ValidationError(_(
+                'Invalid recurrence_type: %s. Must be daily, weekly, or monthly.'
+            ) % self.recurrence_type)
+        
+        recurrence_count = self.recurrence_count
+        recurrence_end_date = self.recurrence_end_date
+        current_start = self.start_datetime
+        current_end = self.end_datetime
+        
+        if isinstance(step, timedelta):
+            # Fixed steps in whole days: the number of children is known up front
+            limits = []
+            if recurrence_count:
+                limits.append(recurrence_count - 1)
+            if recurrence_end_date:
+                limits.append((recurrence_end_date - current_start.date()).days // step.days)
+            return [
+                (current_start + step * index, current_end + step * index)
+                for index in range(1, max(0, min(limits)) + 1)
+            ]
+        
+        # Month lengths vary, so monthly steps are accumulated one by one
+        occurrences = []
+        # The parent is occurrence 1, so recurrence_count allows recurrence_count - 1 children
+        while not recurrence_count or len(occurrences) + 2 <= recurrence_count:
+            current_start = current_start + step
+            current_end = current_end + step
+            if recurrence_end_date and current_start.date() > recurrence_end_date:
+                break
+            occurrences.append((current_start, current_end))
+        return occurrences
+
+    def _get_occurrence_conflicts(self, occurrences):
+        """
+        Find, in a single query, the first active booking of the facility
+        overlapping each occurrence of a recurring series.
+        
+        :param occurrences: list of (occurrence number, start_datetime, end_datetime)
+        :return: dict mapping occurrence number to the conflicting booking reference
+        """
+        self.ensure_one()
+        if not occurrences:
+            return {}
+        
+        self.flush_model([
+            'facility_id', 'status', 'start_datetime', 'end_datetime', 'active', 'booking_reference'
+        ])
+        values_sql = ', '.join(['(%s, %s::timestamp, %s::timestamp)'] * len(occurrences))
+        params = [value for occurrence in occurrences for value in occurrence]
+        self.env.cr.execute(f"""
+            SELECT DISTINCT ON (v.occurrence) v.occurrence, b.booking_reference
+              FROM (VALUES {values_sql}) AS v(occurrence, start_datetime, end_datetime)
+              JOIN sports_booking b
+                ON b.facility_id = %s
+               AND b.active
+               AND b.status IN ('draft', 'confirmed')
+               AND tsrange(b.start_datetime, b.end_datetime, '[)')
+                   && tsrange(v.start_datetime, v.end_datetime, '[)')
+          ORDER BY v.occurrence, b.start_datetime
+        """, params + [self.facility_id.id])
+        return dict(self.env.cr.fetchall())
+
     def generate_recurring_bookings(self):
         """
         Generate child bookings based on recurrence settings.
@@ -728,114 +1075,111 @@ class SportsBooking(models.Model):
         
         # Track created bookings
         created_bookings = self.env['sports.booking']
+        # (occurrence number, start, reason) of the occurrences that could not be created
         failed_bookings = []
+        # (occurrence number, start, values) of the available occurrences to create
+        pending_occurrences = []
         
-        # Starting point for next occurrence
-        current_start = self.start_datetime
-        current_end = self.end_datetime
-        occurrence_count = 0
-        
-        # Loop to create recurring bookings
-        while True:
-            # Calculate next occurrence date
-            if self.recurrence_type == 'daily':
-                current_start = current_start + timedelta(days=1)
-                current_end = current_end + timedelta(days=1)
-            elif self.recurrence_type == 'weekly':
-                current_start = current_start + timedelta(days=7)
-                current_end = current_end + timedelta(days=7)
-            elif self.recurrence_type == 'monthly':
-                current_start = current_start + relativedelta(months=1)
-                current_end = current_end + relativedelta(months=1)
-            else:
-                raise ValidationError(_(
-                    'Invalid recurrence_type: %s. Must be daily, weekly, or monthly.'
-                ) % self.recurrence_type)
-            
-            occurrence_count += 1
-            
-            # Check stop conditions
-            if self.recurrence_count and occurrence_count >= self.recurrence_count:
-                break
-            
-            if self.recurrence_end_date:
-                # Convert datetime to date for comparison
-                next_booking_date = current_start.date()
-                if next_booking_date > self.recurrence_end_date:
-                    break
-            
+        # Compute every occurrence first so availability is checked with one query
+        occurrences = [
+            (occurrence_count, current_start, current_end)
+            for occurrence_count, (current_start, current_end)
+            in enumerate(self._generate_occurrence_datetimes(), start=1)
+        ]
+        
+        # Find, in one query, the first active booking conflicting with each occurrence
+        conflicts = self._get_occurrence_conflicts(occurrences)
+        
+        # Values shared by every child booking
+        facility_id = self.facility_id.id
+        customer_id = self.customer_id.id
+        equipment_ids = self.equipment_ids.ids
+        parent_reference = self.booking_reference
+        
+        for occurrence_count, current_start, current_end in occurrences:
             # Prepare child booking values
             booking_vals = {
-                'facility_id': self.facility_id.id,
-                'customer_id': self.customer_id.id,
+                'facility_id': facility_id,
+                'customer_id': customer_id,
                 'start_datetime': current_start,
                 'end_datetime': current_end,
-                'equipment_ids': [(6, 0, self.equipment_ids.ids)],
+                'equipment_ids': [(6, 0, equipment_ids)],
                 'status': 'draft',  # Child bookings start as draft
                 'notes': _('Recurring booking (Occurrence %d) generated from %s') % (
-                    occurrence_count, self.booking_reference
+                    occurrence_count, parent_reference
                 ),
                 'parent_booking_id': self.id,
                 'is_recurring': False,  # Child bookings are not themselves recurring
             }
             
-            try:
-                # Check if slot is available before creating
-                overlapping = self.search([
-                    ('facility_id', '=', self.facility_id.id),
-                    ('status', 'in', ['draft', 'confirmed']),
-                    ('start_datetime', '<', current_end),
-                    ('end_datetime', '>', current_start),
-                ])
-                
-                if overlapping:
-                    failed_bookings.append({
-                        'occurrence': occurrence_count,
-                        'date': current_start,
-                        'reason': _('Facility not available - conflicts with booking %s') % 
-                                 overlapping[0].booking_reference
-                    })
-                    _logger.warning(
-                        'Skipping recurring booking occurrence %d for %s: slot not available',
-                        occurrence_count, self.booking_reference
-                    )
-                    continue
-                
-                # Create the child booking
-                child_booking = self.create(booking_vals)
-                created_bookings |= child_booking
-                
-                _logger.info(
-                    'Created recurring booking %s (occurrence %d) from parent %s',
-                    child_booking.booking_reference, occurrence_count, self.booking_reference
+            # Check if slot is available before creating
+            if occurrence_count in conflicts:
+                failed_bookings.append((
+                    occurrence_count,
+                    current_start,
+                    _('Facility not available - conflicts with booking %s') % conflicts[occurrence_count]
+                ))
+                _logger.warning(
+                    'Skipping recurring booking occurrence %d for %s: slot not available',
+                    occurrence_count, self.booking_reference
                 )
-                
+                continue
+            
+            pending_occurrences.append((occurrence_count, current_start, booking_vals))
+        
+        # Create all available occurrences with a single batched create; the
+        # parent chatter already documents the series, so skip per-child
+        # creation messages, field tracking and follower subscription
+        Booking = self.with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_create_nosubscribe=True,
+            mail_notrack=True,
+        )
+        if pending_occurrences:
+            try:
+                with self.env.cr.savepoint():
+                    created_bookings = Booking.create([vals for _occ, _start, vals in pending_occurrences])
             except Exception as e:
-                failed_bookings.append({
-                    'occurrence': occurrence_count,
-                    'date': current_start,
-                    'reason': str(e)
-                })
-                _logger.error(
-                    'Failed to create recurring booking occurrence %d for %s: %s',
-                    occurrence_count, self.booking_reference, str(e)
+                # Retry one by one so a single invalid occurrence does not block the others
+                created_ids = []
+                _logger.warning(
+                    'Batch creation of recurring bookings for %s failed, retrying per occurrence: %s',
+                    self.booking_reference, str(e)
                 )
+                for occurrence, occurrence_start, booking_vals in pending_occurrences:
+                    try:
+                        with self.env.cr.savepoint():
+                            child_booking = Booking.create(booking_vals)
+                        created_ids.append(child_booking.id)
+                    except Exception as e:
+                        failed_bookings.append((occurrence, occurrence_start, str(e)))
+                        _logger.error(
+                            'Failed to create recurring booking occurrence %d for %s: %s',
+                            occurrence, self.booking_reference, str(e)
+                        )
+                created_bookings = self.browse(created_ids)
         
         # Log summary
         _logger.info(
             'Recurring booking generation complete for %s: %d created, %d failed',
             self.booking_reference, len(created_bookings), len(failed_bookings)
         )
+        if created_bookings and _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                'Recurring bookings created from %s: %s',
+                self.booking_reference, ', '.join(created_bookings.mapped('booking_reference'))
+            )
         
         # If all bookings failed, raise error
         if not created_bookings and failed_bookings:
             failure_details = '\n'.join([
                 _('Occurrence %d (%s): %s') % (
-                    fb['occurrence'], 
-                    fb['date'].strftime('%Y-%m-%d %H:%M'),
-                    fb['reason']
+                    occurrence, 
+                    occurrence_start.strftime('%Y-%m-%d %H:%M'),
+                    reason
                 )
-                for fb in failed_bookings[:5]  # Show first 5 failures
+                for occurrence, occurrence_start, reason in failed_bookings[:5]  # Show first 5 failures
             ])
             raise UserError(_(
                 'Failed to create any recurring bookings. Details:\n%s%s'
@@ -852,10 +1196,10 @@ class SportsBooking(models.Model):
 
     def action_reset_to_draft(self):
         """Reset booking to draft status"""
-        for record in self:
-            if record.status == 'completed':
-                raise ValidationError(_('Completed bookings cannot be reset to draft.'))
-            record.write({'status': 'draft'})
+        if self.filtered(lambda b: b.status == 'completed'):
+            raise ValidationError(_('Completed bookings cannot be reset to draft.'))
+        self.with_context(mail_notrack=True).write({'status': 'draft'})
+        self._log_status_change(_('Booking reset to draft'))
         return True
 
     @api.model
@@ -864,7 +1208,12 @@ class SportsBooking(models.Model):
         Scheduled action to send booking reminders for bookings happening in the next 24 hours
         Runs daily at 9:00 AM
         """
-        from datetime import datetime
+        # Without the template there is nothing to send
+        template = self.env.ref('sport_facility_booking_system.email_template_booking_reminder', 
+                                raise_if_not_found=False)
+        if not template:
+            _logger.warning('Reminder email template not found, no booking reminders sent')
+            return True
         
         # Calculate time range: now to now + 24 hours
         now = fields.Datetime.now()
@@ -872,9 +1221,10 @@ class SportsBooking(models.Model):
         
         # Search for confirmed bookings starting in the next 24 hours
         upcoming_bookings = self.env['sports.booking'].search([
+            ('status', '=', 'confirmed'),
             ('start_datetime', '>=', now),
             ('start_datetime', '<=', tomorrow),
-            ('status', '=', 'confirmed'),
+            ('reminder_sent', '=', False),
         ])
         
         _logger.info(
@@ -882,27 +1232,24 @@ class SportsBooking(models.Model):
             len(upcoming_bookings)
         )
         
-        # Send reminder email to each booking
+        # Send reminder email to each booking; mails are queued and delivered
+        # by the mail queue cron instead of one SMTP session per booking
         reminder_count = 0
         error_count = 0
+        reminded_bookings = []
         
         for booking in upcoming_bookings:
             try:
-                template = self.env.ref('sport_facility_booking_system.email_template_booking_reminder', 
-                                       raise_if_not_found=False)
-                if template:
-                    template.send_mail(booking.id, force_send=True)
-                    reminder_count += 1
-                    _logger.info(
-                        'Reminder email sent for booking %s (Customer: %s, Facility: %s, Start: %s)',
-                        booking.booking_reference,
-                        booking.customer_id.name,
-                        booking.facility_id.name,
-                        booking.start_datetime
-                    )
-                else:
-                    _logger.warning('Reminder email template not found')
-                    error_count += 1
+                template.send_mail(booking.id, force_send=False)
+                reminder_count += 1
+                reminded_bookings.append(booking.id)
+                _logger.debug(
+                    'Reminder email queued for booking %s (Customer: %s, Facility: %s, Start: %s)',
+                    booking.booking_reference,
+                    booking.customer_id.name,
+                    booking.facility_id.name,
+                    booking.start_datetime
+                )
             except Exception as e:
                 error_count += 1
                 _logger.error(
@@ -911,8 +1258,11 @@ class SportsBooking(models.Model):
                     str(e)
                 )
         
+        # Flag the reminded bookings so later runs skip them
+        self.browse(reminded_bookings).write({'reminder_sent': True})
+        
         _logger.info(
-            'Booking reminder cron completed. Sent: %d, Errors: %d, Total: %d',
+            'Booking reminder cron completed. Queued: %d, Errors: %d, Total: %d',
             reminder_count,
             error_count,
             len(upcoming_bookings)
@@ -926,8 +1276,6 @@ class SportsBooking(models.Model):
         Scheduled action to archive old completed bookings (older than 30 days)
         Runs daily to keep the active booking list clean
         """
-        from datetime import datetime
-        
         # Calculate the cutoff date: 30 days ago from now
         now = fields.Datetime.now()
         cutoff_date = now - timedelta(days=30)
@@ -944,27 +1292,32 @@ class SportsBooking(models.Model):
             len(expired_bookings)
         )
         
-        # Archive the bookings by setting active=False
+        # Archive the bookings by setting active=False in a single write
         archived_count = 0
         error_count = 0
         
-        for booking in expired_bookings:
-            try:
-                booking.write({'active': False})
-                archived_count += 1
-                _logger.debug(
-                    'Archived booking %s (Customer: %s, End Date: %s)',
-                    booking.booking_reference,
-                    booking.customer_id.name,
-                    booking.end_datetime
-                )
-            except Exception as e:
-                error_count += 1
-                _logger.error(
-                    'Failed to archive booking %s: %s',
-                    booking.booking_reference,
-                    str(e)
-                )
+        try:
+            with self.env.cr.savepoint():
+                expired_bookings.write({'active': False})
+            archived_count = len(expired_bookings)
+        except Exception as e:
+            # Fall back to one write per booking to isolate the failing ones
+            _logger.warning(
+                'Bulk archiving of expired bookings failed, retrying per booking: %s',
+                str(e)
+            )
+            for booking in expired_bookings:
+                try:
+                    with self.env.cr.savepoint():
+                        booking.write({'active': False})
+                    archived_count += 1
+                except Exception as e:
+                    error_count += 1
+                    _logger.error(
+                        'Failed to archive booking %s: %s',
+                        booking.booking_reference,
+                        str(e)
+                    )
         
         _logger.info(
             'Archive expired bookings cron completed. Archived: %d, Errors: %d, Total: %d',
@@ -975,9 +1328,9 @@ class SportsBooking(models.Model):
         
         return True
 
-    def name_get(self):
-        result = []
+    @api.depends('booking_reference', 'facility_id.name')
+    def _compute_display_name(self):
+        # Load every facility name of the recordset in one query
+        self.facility_id.fetch(['name'])
         for record in self:
-            name = f"{record.booking_reference} - {record.facility_id.name if record.facility_id else 'N/A'}"
-            result.append((record.id, name))
-        return result
+            record.display_name = f"{record.booking_reference} - {record.facility_id.name or 'N/A'}"
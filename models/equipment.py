@@ -125,6 +125,19 @@ class SportsEquipment(models.Model):
                     'Available quantity cannot exceed total quantity.'
                 ))
 
+    def write(self, vals):
+        """Reprice the open bookings using the equipment when its rental rate changes"""
+        result = super(SportsEquipment, self).write(vals)
+        if 'rental_rate' in vals:
+            # Bookings of every customer, not only those the current user may read
+            bookings = self.env['sports.booking'].sudo().search([
+                ('equipment_ids', 'in', self.ids),
+                ('status', 'in', ['draft', 'confirmed']),
+            ])
+            # Marks equipment_cost, and total_cost through it, for recomputation
+            bookings.modified(['equipment_ids'])
+        return result
+
     def check_availability(self, quantity=1):
         """
         Check if the requested quantity of equipment is available
@@ -174,6 +187,100 @@ class SportsEquipment(models.Model):
         self.quantity_available = new_available
         return True
 
+    def checkout_equipment_bulk(self, qty_by_id):
+        """
+        Checkout several pieces of equipment at once, with a single UPDATE
+        that only succeeds if every piece has enough quantity available
+        
+        :param qty_by_id: dict mapping equipment ID to the quantity to checkout
+        :return: True if successful
+        :raises UserError: Listing every equipment with insufficient quantity
+        """
+        if self._adjust_available_quantities({
+            equipment_id: -quantity for equipment_id, quantity in qty_by_id.items()
+        }):
+            return True
+        
+        errors = [
+            _('%s: Requested: %s, Available: %s') % (
+                equipment.name, qty_by_id[equipment.id], equipment.quantity_available
+            )
+            for equipment in self.browse(list(qty_by_id))
+            if not equipment.check_availability(qty_by_id[equipment.id])
+        ]
+        raise UserError(_('Insufficient quantity available.\n%s') % '\n'.join(errors))
+
+    def return_equipment_bulk(self, qty_by_id):
+        """
+        Return several pieces of equipment at once, with a single UPDATE
+        that only succeeds if no return exceeds the total quantity
+        
+        :param qty_by_id: dict mapping equipment ID to the quantity to return
+        :return: True if successful
+        :raises ValidationError: Listing every return that would exceed total quantity
+        """
+        if self._adjust_available_quantities(qty_by_id):
+            return True
+        
+        errors = [
+            _('%s: Total: %s, Current Available: %s, Returning: %s') % (
+                equipment.name, equipment.total_quantity,
+                equipment.quantity_available, qty_by_id[equipment.id]
+            )
+            for equipment in self.browse(list(qty_by_id))
+            if equipment.quantity_available + qty_by_id[equipment.id] > equipment.total_quantity
+        ]
+        raise ValidationError(_('Return quantity would exceed total quantity.\n%s') % '\n'.join(errors))
+
+    def _adjust_available_quantities(self, delta_by_id):
+        """
+        Add a delta to the available quantity of several pieces of equipment in
+        one UPDATE, keeping each result between 0 and the total quantity.
+        The bounds are checked by the UPDATE itself, so concurrent checkouts
+        cannot both take the last unit. Nothing is changed unless every
+        piece of equipment can be adjusted.
+        The raw UPDATE bypasses write() and its field tracking, so the change
+        is logged in the chatter of each piece of equipment here instead.
+        
+        :param delta_by_id: dict mapping equipment ID to the quantity to add
+                            (negative to checkout)
+        :return: True if all quantities were adjusted, False otherwise
+        """
+        if not delta_by_id:
+            return True
+        
+        self.flush_model(['quantity_available', 'total_quantity'])
+        equipments = self.browse(list(delta_by_id))
+        values_sql = ', '.join(['(%s, %s)'] * len(delta_by_id))
+        params = [value for item in delta_by_id.items() for value in item]
+        with self.env.cr.savepoint(flush=False) as savepoint:
+            self.env.cr.execute(f"""
+                UPDATE sports_equipment e
+                   SET quantity_available = e.quantity_available + v.delta,
+                       write_uid = %s,
+                       write_date = (now() at time zone 'UTC')
+                  FROM (VALUES {values_sql}) AS v(id, delta)
+                 WHERE e.id = v.id
+                   AND e.quantity_available + v.delta BETWEEN 0 AND e.total_quantity
+             RETURNING e.id, e.quantity_available - v.delta, e.quantity_available
+            """, [self.env.uid] + params)
+            changes = self.env.cr.fetchall()
+            adjusted = len(changes) == len(delta_by_id)
+            if not adjusted:
+                savepoint.rollback()
+        
+        # The cache still holds the previous quantities
+        equipments.invalidate_recordset(['quantity_available', 'write_uid', 'write_date'])
+        if adjusted:
+            equipments.modified(['quantity_available'])
+            if not self.env.context.get('tracking_disable') and not self.env.context.get('mail_notrack'):
+                field_label = self._fields['quantity_available'].string
+                equipments._message_log_batch(bodies={
+                    equipment_id: '%s: %s → %s' % (field_label, old_quantity, new_quantity)
+                    for equipment_id, old_quantity, new_quantity in changes
+                })
+        return adjusted
+
     @api.model
     def get_available_equipment(self, equipment_type=None, facility_id=None):
         """
@@ -16,6 +16,7 @@ class SportsMembership(models.Model):
         string='Member',
         required=True,
         ondelete='restrict',
+        index=True,
         help='Member associated with this membership'
     )
     
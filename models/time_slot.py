@@ -15,6 +15,7 @@ class SportsTimeSlot(models.Model):
         string='Facility',
         required=True,
         ondelete='cascade',
+        index=True,
         help='The facility for this time slot'
     )
     
@@ -48,6 +49,7 @@ class SportsTimeSlot(models.Model):
         'sports.booking',
         string='Booking',
         ondelete='set null',
+        index='btree_not_null',
         help='Associated booking if this slot is reserved'
     )
     
@@ -103,14 +105,14 @@ class SportsTimeSlot(models.Model):
                 end_datetime = self._convert_to_datetime(record.date, record.end_time)
                 
                 # Search for overlapping bookings
-                overlapping_bookings = self.env['sports.booking'].search([
+                overlapping_bookings = self.env['sports.booking'].search_count([
                     ('facility_id', '=', record.facility_id.id),
                     ('status', 'in', ['draft', 'confirmed']),
                     ('start_datetime', '<', end_datetime),
                     ('end_datetime', '>', start_datetime),
-                ])
+                ], limit=1)
                 
-                record.is_available = not bool(overlapping_bookings)
+                record.is_available = not overlapping_bookings
             else:
                 record.is_available = True
 
@@ -119,13 +121,13 @@ class SportsTimeSlot(models.Model):
         """Prevent overlapping time slots for the same facility on the same date"""
         for record in self:
             if record.facility_id and record.date and record.start_time and record.end_time:
-                overlapping_slots = self.search([
+                overlapping_slots = self.search_count([
                     ('id', '!=', record.id),
                     ('facility_id', '=', record.facility_id.id),
                     ('date', '=', record.date),
                     ('start_time', '<', record.end_time),
                     ('end_time', '>', record.start_time),
-                ])
+                ], limit=1)
                 
                 if overlapping_slots:
                     raise ValidationError(_(
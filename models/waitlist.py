@@ -19,6 +19,7 @@ class SportsWaitlist(models.Model):
         string='Customer',
         required=True,
         ondelete='cascade',
+        index=True,
         tracking=True,
         help='Customer requesting to be notified when facility becomes available'
     )
@@ -28,6 +29,7 @@ class SportsWaitlist(models.Model):
         string='Facility',
         required=True,
         ondelete='cascade',
+        index=True,
         tracking=True,
         help='Facility the customer is waiting for'
     )
@@ -151,6 +153,10 @@ class SportsWaitlist(models.Model):
         Mark the waitlist entry as notified and send notification to customer.
         Can be called manually or automatically when a slot becomes available.
         """
+        # Notification emails are queued and sent by the mail queue cron
+        template = self.env.ref('sport_facility_system.email_template_waitlist_notification', 
+                                raise_if_not_found=False)
+        
         for record in self:
             if record.status != 'waiting':
                 raise ValidationError(_(
@@ -166,12 +172,10 @@ class SportsWaitlist(models.Model):
             
             # Send email notification (template to be created)
             try:
-                template = self.env.ref('sport_facility_system.email_template_waitlist_notification', 
-                                       raise_if_not_found=False)
                 if template:
-                    template.send_mail(record.id, force_send=True)
+                    template.send_mail(record.id, force_send=False)
                     _logger.info(
-                        'Waitlist notification email sent to %s for facility %s',
+                        'Waitlist notification email queued for %s for facility %s',
                         record.customer_id.name, record.facility_id.name
                     )
             except Exception as e:
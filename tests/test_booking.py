@@ -104,6 +104,15 @@ class TestSportsBooking(TransactionCase):
                 'status': 'confirmed',
             })
         
+        # The facility may come from the context defaults instead of the values
+        with self.assertRaises(ValidationError,
+                             msg="Should raise ValidationError for overlap with a default facility"):
+            self.env['sports.booking'].with_context(default_facility_id=self.facility.id).create({
+                'customer_id': self.customer.id,
+                'start_datetime': self.start_datetime,
+                'end_datetime': self.end_datetime,
+            })
+        
         # Test partial overlap at the start
         with self.assertRaises(ValidationError,
                              msg="Should raise ValidationError for partial overlap at start"):
@@ -147,6 +156,11 @@ class TestSportsBooking(TransactionCase):
         
         self.assertTrue(booking_different_facility,
                        "Booking on different facility should be allowed")
+        
+        # Moving it onto the first facility at the same time must be rejected too
+        with self.assertRaises(ValidationError,
+                             msg="Should raise ValidationError when rescheduling onto a booked slot"):
+            booking_different_facility.write({'facility_id': self.facility.id})
     
     def test_cost_calculation(self):
         """Test 3: Verify total_cost computes correctly with equipment"""
@@ -219,6 +233,8 @@ class TestSportsBooking(TransactionCase):
         expected_cost_with_discount = 48.00
         
         # Assertions
+        self.assertEqual(booking.discount_percentage, 20.00,
+                        "Booking should carry the 20% membership discount")
         self.assertEqual(booking.total_cost, expected_cost_with_discount,
                         f"Total cost with 20% discount should be {expected_cost_with_discount}")
         
@@ -329,3 +345,71 @@ class TestSportsBooking(TransactionCase):
                         "Equipment1 quantity should be restored to 10 after cancellation")
         self.assertEqual(self.equipment2.quantity_available, 20,
                         "Equipment2 quantity should be restored to 20 after cancellation")
+    
+    def test_batch_creation(self):
+        """Test 6: Create several bookings in one call and verify each gets its own reference"""
+        bookings = self.env['sports.booking'].create([{
+            'facility_id': self.facility.id,
+            'customer_id': self.customer.id,
+            'start_datetime': self.start_datetime + timedelta(days=day),
+            'end_datetime': self.end_datetime + timedelta(days=day),
+            'status': 'draft',
+        } for day in range(5, 8)])
+        
+        # Assertions
+        self.assertEqual(len(bookings), 3, "All bookings should be created")
+        references = bookings.mapped('booking_reference')
+        self.assertNotIn('New', references,
+                        "Every booking reference should be auto-generated")
+        self.assertEqual(len(set(references)), 3,
+                        "Booking references should be unique")
+    
+    def test_rental_rate_change(self):
+        """Test 7: Change a rental rate and verify only open bookings are repriced"""
+        draft_booking = self.env['sports.booking'].create({
+            'facility_id': self.facility.id,
+            'customer_id': self.customer.id,
+            'start_datetime': self.start_datetime,
+            'end_datetime': self.end_datetime,
+            'equipment_ids': [(6, 0, [self.equipment1.id])],
+        })
+        completed_booking = self.env['sports.booking'].create({
+            'facility_id': self.facility.id,
+            'customer_id': self.customer.id,
+            'start_datetime': self.start_datetime + timedelta(days=1),
+            'end_datetime': self.end_datetime + timedelta(days=1),
+            'equipment_ids': [(6, 0, [self.equipment1.id])],
+            'status': 'completed',
+        })
+        
+        # Raise Equipment1 rate from 5.00 to 8.00 per hour
+        self.equipment1.rental_rate = 8.00
+        
+        # Draft: (25.00 + 8.00) * 2 hours = 66.00
+        self.assertEqual(draft_booking.total_cost, 66.00,
+                        "Draft booking should use the new rental rate")
+        # Completed: (25.00 + 5.00) * 2 hours = 60.00
+        self.assertEqual(completed_booking.total_cost, 60.00,
+                        "Completed booking should keep its original price")
+    
+    def test_reset_to_draft_overlap(self):
+        """Test 8: Reset a cancelled booking whose slot was taken and assert ValidationError"""
+        cancelled_booking = self.env['sports.booking'].create({
+            'facility_id': self.facility.id,
+            'customer_id': self.customer.id,
+            'start_datetime': self.start_datetime,
+            'end_datetime': self.end_datetime,
+        })
+        cancelled_booking.action_cancel()
+        
+        # The freed slot can be booked by someone else
+        self.env['sports.booking'].create({
+            'facility_id': self.facility.id,
+            'customer_id': self.customer.id,
+            'start_datetime': self.start_datetime,
+            'end_datetime': self.end_datetime,
+        })
+        
+        with self.assertRaises(ValidationError,
+                             msg="Should raise ValidationError when the slot is taken again"):
+            cancelled_booking.action_reset_to_draft()
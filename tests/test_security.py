@@ -322,4 +322,22 @@ class TestSecurityAccess(TransactionCase):
         self.assertTrue(booking, "Manager should be able to create booking")
         self.assertEqual(booking.customer_id.id, self.customer1.id,
                         "Manager should be able to create booking for any customer")
-
+    
+    def test_12_user_rate_change_reprices_other_bookings(self):
+        """Test 12: Rental rate change by a Sports User reprices other customers' open bookings"""
+        # Booking of customer2, not visible to the first sports user
+        booking = self.env['sports.booking'].sudo().create({
+            'facility_id': self.facility.id,
+            'customer_id': self.customer2.id,
+            'start_datetime': self.start_datetime,
+            'end_datetime': self.end_datetime,
+            'equipment_ids': [(6, 0, [self.equipment.id])],
+            'status': 'draft',
+        })
+        
+        # Sports user raises the rate from 5.00 to 8.00 per hour
+        self.equipment.with_user(self.user_sports_user).write({'rental_rate': 8.00})
+        
+        # Equipment: 8.00 * 2 hours = 16.00
+        self.assertEqual(booking.equipment_cost, 16.00,
+                        "Other customers' open bookings should use the new rental rate")